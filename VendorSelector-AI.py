@@ -1,27 +1,304 @@
-import json
 import csv
-from typing import Dict, List, Union
-from dataclasses import dataclass
-from io import StringIO
-from datetime import datetime
+import os
+from array import array
+from typing import IO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from io import BytesIO, StringIO, TextIOWrapper
+from itertools import filterfalse, islice, repeat
+from operator import add, itemgetter, mul, truediv
 
-@dataclass
-class Supplier:
+try:
+    # orjson parses str and bytes natively and much faster; fall back to the stdlib.
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+LATE_GREETING = "Hello! VendorSelector-AI is working late to assist you."
+# Time-of-day greeting for each hour 0-23.
+HOURLY_GREETINGS = (
+    (LATE_GREETING,) * 5
+    + ("Good morning! VendorSelector-AI is ready to assist you.",) * 7
+    + ("Good afternoon! Let's evaluate your supplier data together.",) * 5
+    + ("Good evening! I'm here to help review your supplier details.",) * 5
+    + (LATE_GREETING,) * 2
+)
+
+REQUIRED_FIELDS = ("supplier_id", "price_score", "delivery_reliability_score", "quality_rating_score")
+SCORE_FIELDS = REQUIRED_FIELDS[1:]
+SCORE_WEIGHTS = (0.4, 0.3, 0.3)
+UNSUPPORTED_LANGUAGE_ERROR = "ERROR: Unsupported language detected. Please use ENGLISH."
+# CSV rows are converted and scored in batches of this size while the input streams in.
+CSV_CHUNK_SIZE = 100_000
+# Files opened from a path are read in 1 MiB blocks rather than the default 8 KiB,
+# cutting the number of read() syscalls on large inputs.
+READ_BUFFER_SIZE = 1 << 20
+# At most this many rendered final reports (one per top_k) are kept per instance.
+REPORT_CACHE_SIZE = 8
+
+# Input may be given as in-memory text or bytes, a path, or an open file object.
+DataSource = Union[str, bytes, os.PathLike, IO]
+
+REQUIRED_FIELD_STATUS = {
+    "supplier_id": "Present",
+    "price_score": "Present",
+    "delivery_reliability_score": "Present",
+    "quality_rating_score": "Present"
+}
+DATA_TYPE_STATUS = {
+    "Price Score": "Valid",
+    "Delivery Reliability Score": "Valid",
+    "Quality Rating Score": "Valid"
+}
+
+# Report templates, filled with %-formatting so each section is rendered in a single call.
+REPORT_HEADER_TEMPLATE = (
+    "\n"
+    "# Formulas Used:\n"
+    "1. Overall Supplier Score Formula:\n"
+    r"$$\text{Overall Score} = \left(\frac{\text{price_score}}{100} \times 0.4 \right) + \left(\frac{\text{delivery_reliability_score}}{100} \times 0.3 \right) + \left(\frac{\text{quality_rating_score}}{100} \times 0.3 \right)$$" "\n"
+    "\n"
+    "# Supplier Evaluation Summary\n"
+    "Total Suppliers Evaluated: %d\n"
+    "\n"
+    "# Detailed Analysis for Each Supplier"
+)
+SUPPLIER_ANALYSIS_TEMPLATE = (
+    "## Supplier %s\n"
+    "### Input Data:\n"
+    "- Price Score: %s\n"
+    "- Delivery Reliability Score: %s\n"
+    "- Quality Rating Score: %s\n"
+    "\n"
+    "### Detailed Calculations:\n"
+    "\n"
+    "1. Sum the scores:\n"
+    "   - Price Score: %s × 0.4 = %s\n"
+    "   - Delivery Reliability Score: %s × 0.3 = %s\n"
+    "   - Quality Rating Score: %s × 0.3 = %s\n"
+    "2. Compute Overall Score:\n"
+    "   $\\text{Overall Score} = %s + %s + %s = %s$\n"
+    "\n"
+    "### Ranking Status:\n"
+    "- %s"
+)
+TOP_VENDOR_STATUS = "Selected as Top Vendor"
+RANK_STATUS_TEMPLATE = "Rank: %d"
+REMAINING_RANKING_HEADER = (
+    "\n"
+    "# Remaining Suppliers\n"
+    "| Rank | Supplier | Overall Score |\n"
+    "|---|---|---|"
+)
+REMAINING_RANKING_ROW_TEMPLATE = "\n| %d | %s | %s |"
+TOP_SUPPLIER_TEMPLATE = "\n- Supplier %s"
+FINAL_RANKING_TEMPLATE = (
+    "\n"
+    "# Final Ranking\n"
+    "Top supplier(s) with overall score of %s:"
+)
+VALIDATION_REPORT_HEADER = (
+    "# Data Validation Report\n"
+    "## 1. Data Structure Check:\n"
+    "- Number of suppliers: "
+)
+FEEDBACK_REQUEST = (
+    "\n"
+    "# Feedback Request\n"
+    "Would you like detailed calculations for any specific supplier? Rate this analysis (1-5)."
+)
+
+def _weighted_scores(scores, weight: float):
+    # (score / 100) * weight for every score. Folding the division into the weight
+    # (score * 0.004) would round ties differently.
+    return map(mul, map(truediv, scores, repeat(100)), repeat(weight))
+
+def _score_components(price_scores: Iterable[float], delivery_scores: Iterable[float],
+                      quality_scores: Iterable[float]) -> Iterator[Tuple[float, float, float]]:
+    # Weighted components rounded to two decimals, one tuple per row.
+    return zip(*(map(round, _weighted_scores(scores, weight), repeat(2))
+                 for scores, weight in zip((price_scores, delivery_scores, quality_scores), SCORE_WEIGHTS)))
+
+def _overall_scores(price_scores: array, delivery_scores: array, quality_scores: array) -> array:
+    price, delivery, quality = map(_weighted_scores, (price_scores, delivery_scores, quality_scores), SCORE_WEIGHTS)
+    return array("d", map(round, map(add, map(add, price, delivery), quality), repeat(2)))
+
+def _first_invalid_index(column: array) -> int:
+    # Position of the first score outside [0, 100], or len(column) if there is none.
+    return next((index for index, score in enumerate(column) if not 0 <= score <= 100), len(column))
+
+def _score_and_validate(price_scores: array, delivery_scores: array,
+                        quality_scores: array) -> Tuple[array, Optional[Tuple[int, int]]]:
+    # Scoring kernel over whole columns. Returns the overall scores, or the
+    # (row, column) of the first out-of-range score in row-major order.
+    score_columns = (price_scores, delivery_scores, quality_scores)
+    # `0 <= x` and `100 >= x` are both False for NaN, so it is rejected as well.
+    if all(all(map((0.0).__le__, column)) and all(map((100.0).__ge__, column)) for column in score_columns):
+        return _overall_scores(*score_columns), None
+    first_invalid = list(map(_first_invalid_index, score_columns))
+    row = min(first_invalid)
+    return array("d"), (row, first_invalid.index(row))
+
+def _csv_transposer(indices: List[int]) -> Callable[[List[List[str]]], List[tuple]]:
+    # Builds the function that turns a chunk of CSV rows into the required columns,
+    # specialised once per file from the header. It returns fewer columns than
+    # REQUIRED_FIELDS when a row is too short.
+    if indices == list(range(len(REQUIRED_FIELDS))):
+        # Canonical schema order: transpose the rows directly and stop after the
+        # required columns, with no per-row projection.
+        return lambda chunk: list(islice(zip(*chunk), len(REQUIRED_FIELDS)))
+
+    project = itemgetter(*indices)
+
+    def transpose(chunk: List[List[str]]) -> List[tuple]:
+        try:
+            return list(zip(*map(project, chunk)))
+        except IndexError:
+            return []
+    return transpose
+
+def _ascii_line(line: str) -> str:
+    if not line.isascii():
+        raise ValueError(UNSUPPORTED_LANGUAGE_ERROR)
+    return line
+
+@contextmanager
+def _csv_lines(source: DataSource) -> Iterator[Iterable[str]]:
+    # Yields the CSV input as an iterable of ASCII text lines without reading it
+    # into memory first. Non-ASCII input raises ValueError or UnicodeDecodeError.
+    if isinstance(source, os.PathLike):
+        with open(source, "rb", buffering=READ_BUFFER_SIZE) as stream, _csv_lines(stream) as lines:
+            yield lines
+        return
+    if isinstance(source, str):
+        # str.isascii() only reads CPython's cached ASCII flag, so this is not a scan.
+        if not source.isascii():
+            raise ValueError(UNSUPPORTED_LANGUAGE_ERROR)
+        yield StringIO(source)
+        return
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+    if isinstance(source.read(0), str):
+        yield map(_ascii_line, source)
+        return
+    # Raw bytes are decoded incrementally by the reader; the caller's stream is
+    # detached afterwards so it is not closed along with the wrapper.
+    lines = TextIOWrapper(source, encoding="ascii", newline="")
+    try:
+        yield lines
+    finally:
+        lines.detach()
+
+@lru_cache(maxsize=1)
+def _validation_report_body() -> str:
+    # Everything after the supplier count is fixed, so it is built once and reused.
+    report = [
+        f"- Number of fields per record: {len(REQUIRED_FIELDS)}",
+        "",
+        "## 2. Required Fields Check:"
+    ]
+    report.extend(f"- {name}: {status}" for name, status in REQUIRED_FIELD_STATUS.items())
+    report.extend([
+        "",
+        "## 3. Data Type Validation:"
+    ])
+    report.extend(f"- {name} (positive number): {status}" for name, status in DATA_TYPE_STATUS.items())
+    report.extend([
+        "",
+        "## Validation Summary:",
+        "Data validation is successful! Proceeding with analysis..."
+    ])
+    return "\n".join(report)
+
+def _format_supplier_analysis(supplier_id: str, price: float, delivery: float, quality: float,
+                              components: Tuple[float, float, float], overall: float,
+                              rank: int, is_top: bool) -> str:
+    price_component, delivery_component, quality_component = components
+    return SUPPLIER_ANALYSIS_TEMPLATE % (
+        supplier_id, price, delivery, quality,
+        price, price_component, delivery, delivery_component, quality, quality_component,
+        price_component, delivery_component, quality_component, overall,
+        TOP_VENDOR_STATUS if is_top else RANK_STATUS_TEMPLATE % rank
+    )
+
+class Supplier(NamedTuple):
+    # A single supplier record, as taken by calculate_overall_score() and
+    # generate_supplier_analysis().
     supplier_id: str
     price_score: float
     delivery_reliability_score: float
     quality_rating_score: float
     overall_score: float = 0.0
 
+@dataclass
+class SupplierTable:
+    # Column-oriented supplier storage indexed by row. Scores live in typed double
+    # buffers (8 bytes each) instead of one float object per field. Overall scores
+    # are already rounded to two decimals, so they are kept exactly as int16
+    # hundredths and only turned back into floats when rendered.
+    supplier_ids: List[str] = field(default_factory=list)
+    price_scores: array = field(default_factory=lambda: array("d"))
+    delivery_reliability_scores: array = field(default_factory=lambda: array("d"))
+    quality_rating_scores: array = field(default_factory=lambda: array("d"))
+    overall_hundredths: array = field(default_factory=lambda: array("h"))
+    # Bumped by every extend() and truncate(), so cached output can be validated
+    # in O(1) instead of rehashing the columns.
+    generation: int = field(default=0, repr=False, compare=False)
+    # Rounded score components by row, filled in only for rows that have been
+    # rendered. Rows never move once stored, so extend() leaves these valid.
+    rounded_components: Dict[int, Tuple[float, float, float]] = field(
+        default_factory=dict, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.supplier_ids)
+
+    def extend(self, supplier_ids, price_scores, delivery_scores, quality_scores, overall_scores) -> None:
+        self.supplier_ids.extend(supplier_ids)
+        self.price_scores.extend(price_scores)
+        self.delivery_reliability_scores.extend(delivery_scores)
+        self.quality_rating_scores.extend(quality_scores)
+        self.overall_hundredths.extend(map(round, map(mul, overall_scores, repeat(100))))
+        self.generation += 1
+
+    def truncate(self, length: int) -> None:
+        for column in (self.supplier_ids, self.price_scores, self.delivery_reliability_scores,
+                       self.quality_rating_scores, self.overall_hundredths):
+            del column[length:]
+        for index in [index for index in self.rounded_components if index >= length]:
+            del self.rounded_components[index]
+        self.generation += 1
+
+    def score_components(self, indices: List[int]) -> Iterator[Tuple[float, float, float]]:
+        # Rounded components for the given rows. Rows not seen before are rounded in
+        # one batch and kept, so a later, larger render only pays for the new rows.
+        cached = self.rounded_components
+        missing = list(filterfalse(cached.__contains__, indices))
+        if missing:
+            cached.update(zip(missing, _score_components(*(
+                map(column.__getitem__, missing)
+                for column in (self.price_scores, self.delivery_reliability_scores, self.quality_rating_scores)
+            ))))
+        return map(cached.__getitem__, indices)
+
+    def ranking(self) -> List[int]:
+        # Row indices by descending overall score; ties keep their input order.
+        return sorted(range(len(self)), key=self.overall_hundredths.__getitem__, reverse=True)
+
 class VendorSelectorAI:
     def __init__(self):
-        self.suppliers: List[Supplier] = []
+        self.suppliers = SupplierTable()
         self.validation_report = {
             "structure": {},
             "required_fields": {},
             "data_types": {},
             "summary": ""
         }
+        # Rendered final reports keyed by top_k, valid while self.suppliers is still
+        # _report_table at _report_generation.
+        self._report_table: Optional[SupplierTable] = None
+        self._report_generation = 0
+        self._report_cache: Dict[Optional[int], str] = {}
 
     def get_greeting(self, name: str = None, time: str = None, is_urgent: bool = False) -> str:
         if is_urgent:
@@ -31,25 +308,12 @@ class VendorSelectorAI:
             return f"Hello, {name}! I'm VendorSelector-AI, here to help select the best supplier."
         
         if time:
-            hour = int(time.split(':')[0])
-            if 5 <= hour < 12:
-                return "Good morning! VendorSelector-AI is ready to assist you."
-            elif 12 <= hour < 17:
-                return "Good afternoon! Let's evaluate your supplier data together."
-            elif 17 <= hour < 22:
-                return "Good evening! I'm here to help review your supplier details."
-            else:
-                return "Hello! VendorSelector-AI is working late to assist you."
+            hour = int(time.partition(':')[0])
+            return HOURLY_GREETINGS[hour] if 0 <= hour < 24 else LATE_GREETING
         
         return "Greetings! I am VendorSelector-AI, your supplier evaluation assistant. Please share your supplier data in CSV or JSON format to begin."
 
-    def validate_language(self, text: str) -> bool:
-        # Simplified language check - could be enhanced with proper language detection
-        if not text.isascii():
-            raise ValueError("ERROR: Unsupported language detected. Please use ENGLISH.")
-        return True
-
-    def validate_format(self, data: str, format_type: str) -> bool:
+    def validate_format(self, data: DataSource, format_type: str) -> bool:
         if format_type not in ['csv', 'json']:
             raise ValueError("ERROR: Invalid data format. Please provide CSV or JSON.")
         return True
@@ -61,163 +325,209 @@ class VendorSelectorAI:
             raise ValueError(f"ERROR: Invalid value in {supplier_id}: {field_name}. Please provide scores between 0 and 100.")
         return True
 
-    def parse_input_data(self, data: str, format_type: str) -> None:
-        self.validate_language(data)
+    def parse_input_data(self, data: DataSource, format_type: str) -> None:
         self.validate_format(data, format_type)
-        
-        if format_type == 'csv':
-            self.parse_csv_data(data)
-        else:
-            self.parse_json_data(data)
-
-    def parse_csv_data(self, csv_data: str) -> None:
-        csv_reader = csv.DictReader(StringIO(csv_data))
-        for row in csv_reader:
-            self._process_supplier_data(row)
-
-    def parse_json_data(self, json_data: str) -> None:
-        data = json.loads(json_data)
-        for supplier in data.get("suppliers", []):
-            self._process_supplier_data(supplier)
-
-    def _process_supplier_data(self, data: Dict) -> None:
-        required_fields = ["supplier_id", "price_score", "delivery_reliability_score", "quality_rating_score"]
-        missing_fields = [field for field in required_fields if field not in data]
-        
+
+        # Simplified language check - could be enhanced with proper language detection.
+        # Non-ASCII input is rejected by the parsers as they read it, so it is never
+        # pre-scanned.
+        try:
+            if format_type == 'csv':
+                self.parse_csv_data(data)
+            else:
+                self.parse_json_data(data)
+        except UnicodeDecodeError:
+            raise ValueError(UNSUPPORTED_LANGUAGE_ERROR) from None
+
+    def parse_csv_data(self, csv_data: DataSource) -> None:
+        start = len(self.suppliers)
+        try:
+            with _csv_lines(csv_data) as lines:
+                csv_reader = csv.reader(lines)
+
+                header = next(csv_reader, [])
+                rows = filter(None, csv_reader)
+                chunk = list(islice(rows, CSV_CHUNK_SIZE))
+                if not chunk:
+                    # Input without data rows (including empty input) adds no suppliers
+                    # and, as with DictReader before, is not checked against the header.
+                    return
+
+                # The header is checked once for the whole file; rows are then projected
+                # onto the required fields and transposed into columns chunk by chunk.
+                self._check_required_fields(header)
+                # A repeated column name resolves to its last occurrence, as DictReader did.
+                positions = {name: index for index, name in enumerate(header)}
+                indices = [positions[field] for field in REQUIRED_FIELDS]
+                transpose = _csv_transposer(indices)
+                while chunk:
+                    columns = transpose(chunk)
+                    if len(columns) < len(REQUIRED_FIELDS):
+                        for row in chunk:
+                            missing_fields = [field for field, i in zip(REQUIRED_FIELDS, indices) if i >= len(row)]
+                            if missing_fields:
+                                raise ValueError(f"ERROR: Missing required field(s): {', '.join(missing_fields)}")
+                    self._add_supplier_columns(columns)
+                    chunk = list(islice(rows, CSV_CHUNK_SIZE))
+        except BaseException:
+            # Keep the table unchanged when a later chunk turns out to be invalid.
+            self.suppliers.truncate(start)
+            raise
+
+    def parse_json_data(self, json_data: DataSource) -> None:
+        # A JSON document has to be parsed as a whole, so file input is read in full.
+        if isinstance(json_data, os.PathLike):
+            with open(json_data, "rb") as stream:
+                json_data = stream.read()
+        elif hasattr(json_data, "read"):
+            json_data = json_data.read()
+
+        # Bytes go to the parser as-is instead of being decoded into a str copy first;
+        # their language check is done on the parsed supplier ids below.
+        from_bytes = isinstance(json_data, (bytes, bytearray))
+        if not from_bytes and not json_data.isascii():
+            raise ValueError(UNSUPPORTED_LANGUAGE_ERROR)
+        try:
+            data = _json.loads(json_data)
+        except ValueError:
+            # Non-UTF-8 bytes are reported like any other non-English input.
+            if from_bytes and not json_data.isascii():
+                raise ValueError(UNSUPPORTED_LANGUAGE_ERROR) from None
+            raise
+        records = data.get("suppliers", [])
+        try:
+            columns = list(zip(*map(itemgetter(*REQUIRED_FIELDS), records)))
+        except (KeyError, TypeError):
+            # Only malformed input gets here: report the first incomplete record.
+            for record in records:
+                self._check_required_fields(record)
+            raise
+        # str.isascii() reads CPython's cached ASCII flag, so this is O(1) per id.
+        if from_bytes and columns and not all(
+                supplier_id.isascii() for supplier_id in columns[0] if isinstance(supplier_id, str)):
+            raise ValueError(UNSUPPORTED_LANGUAGE_ERROR)
+        self._add_supplier_columns(columns)
+
+    def _check_required_fields(self, record) -> None:
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in record]
         if missing_fields:
             raise ValueError(f"ERROR: Missing required field(s): {', '.join(missing_fields)}")
 
-        supplier = Supplier(
-            supplier_id=data["supplier_id"],
-            price_score=float(data["price_score"]),
-            delivery_reliability_score=float(data["delivery_reliability_score"]),
-            quality_rating_score=float(data["quality_rating_score"])
-        )
-
-        self.validate_score(supplier.price_score, "price_score", supplier.supplier_id)
-        self.validate_score(supplier.delivery_reliability_score, "delivery_reliability_score", supplier.supplier_id)
-        self.validate_score(supplier.quality_rating_score, "quality_rating_score", supplier.supplier_id)
+    def _add_supplier_columns(self, columns: List[tuple]) -> None:
+        # Converts, validates and scores every score column in bulk.
+        if not columns:
+            return
+        supplier_ids, *raw_columns = columns
+        try:
+            score_columns = [array("d", map(float, column)) for column in raw_columns]
+        except (TypeError, ValueError):
+            # Columns are converted one at a time, so the failing value may not be the
+            # first problem in the input. Re-check row by row to report the same error
+            # a per-record pass would: conversion of a row first, then its ranges.
+            for supplier_id, *values in zip(supplier_ids, *raw_columns):
+                scores = [float(value) for value in values]
+                for field_name, score in zip(SCORE_FIELDS, scores):
+                    self.validate_score(score, field_name, supplier_id)
+            raise
 
-        supplier.overall_score = self.calculate_overall_score(supplier)
-        self.suppliers.append(supplier)
+        overall_scores, invalid = _score_and_validate(*score_columns)
+        if invalid is not None:
+            row, column = invalid
+            self.validate_score(score_columns[column][row], SCORE_FIELDS[column], supplier_ids[row])
+        self.suppliers.extend(supplier_ids, *score_columns, overall_scores)
 
     def calculate_overall_score(self, supplier: Supplier) -> float:
-        price_component = (supplier.price_score / 100) * 0.4
-        delivery_component = (supplier.delivery_reliability_score / 100) * 0.3
-        quality_component = (supplier.quality_rating_score / 100) * 0.3
+        price_weight, delivery_weight, quality_weight = SCORE_WEIGHTS
+        price_component = (supplier.price_score / 100) * price_weight
+        delivery_component = (supplier.delivery_reliability_score / 100) * delivery_weight
+        quality_component = (supplier.quality_rating_score / 100) * quality_weight
         return round(price_component + delivery_component + quality_component, 2)
 
     def generate_validation_report(self) -> str:
+        supplier_count = len(self.suppliers)
         self.validation_report["structure"] = {
-            "suppliers": len(self.suppliers),
-            "fields_per_record": 4
-        }
-        
-        self.validation_report["required_fields"] = {
-            "supplier_id": "Present",
-            "price_score": "Present",
-            "delivery_reliability_score": "Present",
-            "quality_rating_score": "Present"
+            "suppliers": supplier_count,
+            "fields_per_record": len(REQUIRED_FIELDS)
         }
-        
-        self.validation_report["data_types"] = {
-            "Price Score": "Valid",
-            "Delivery Reliability Score": "Valid",
-            "Quality Rating Score": "Valid"
-        }
-        
-        report = [
-            "# Data Validation Report",
-            "## 1. Data Structure Check:",
-            f"- Number of suppliers: {self.validation_report['structure']['suppliers']}",
-            f"- Number of fields per record: {self.validation_report['structure']['fields_per_record']}",
-            "",
-            "## 2. Required Fields Check:"
-        ]
-        
-        for field, status in self.validation_report["required_fields"].items():
-            report.append(f"- {field}: {status}")
-        
-        report.extend([
-            "",
-            "## 3. Data Type Validation:"
-        ])
-        
-        for field, status in self.validation_report["data_types"].items():
-            report.append(f"- {field} (positive number): {status}")
-        
-        report.extend([
-            "",
-            "## Validation Summary:",
-            "Data validation is successful! Proceeding with analysis..."
-        ])
-        
-        return "\n".join(report)
+        self.validation_report["required_fields"] = dict(REQUIRED_FIELD_STATUS)
+        self.validation_report["data_types"] = dict(DATA_TYPE_STATUS)
+
+        return f"{VALIDATION_REPORT_HEADER}{supplier_count}\n{_validation_report_body()}"
 
     def generate_supplier_analysis(self, supplier: Supplier, rank: int, is_top: bool) -> str:
-        price_component = round((supplier.price_score / 100) * 0.4, 2)
-        delivery_component = round((supplier.delivery_reliability_score / 100) * 0.3, 2)
-        quality_component = round((supplier.quality_rating_score / 100) * 0.3, 2)
-        
-        analysis = [
-            f"## Supplier {supplier.supplier_id}",
-            "### Input Data:",
-            f"- Price Score: {supplier.price_score}",
-            f"- Delivery Reliability Score: {supplier.delivery_reliability_score}",
-            f"- Quality Rating Score: {supplier.quality_rating_score}",
-            "",
-            "### Detailed Calculations:",
-            "",
-            "1. Sum the scores:",
-            f"   - Price Score: {supplier.price_score} × 0.4 = {price_component}",
-            f"   - Delivery Reliability Score: {supplier.delivery_reliability_score} × 0.3 = {delivery_component}",
-            f"   - Quality Rating Score: {supplier.quality_rating_score} × 0.3 = {quality_component}",
-            "2. Compute Overall Score:",
-            f"   $\\text{{Overall Score}} = {price_component} + {delivery_component} + {quality_component} = {supplier.overall_score}$",
-            "",
-            "### Ranking Status:",
-            f"- {'Selected as Top Vendor' if is_top else f'Rank: {rank}'}"
-        ]
-        return "\n".join(analysis)
-
-    def generate_final_report(self) -> str:
-        ranked_suppliers = sorted(self.suppliers, key=lambda x: x.overall_score, reverse=True)
-        top_score = ranked_suppliers[0].overall_score if ranked_suppliers else 0
-        
-        report_sections = [
-            self.generate_validation_report(),
-            "",
-            "# Formulas Used:",
-            "1. Overall Supplier Score Formula:",
-            r"$$\text{Overall Score} = \left(\frac{\text{price_score}}{100} \times 0.4 \right) + \left(\frac{\text{delivery_reliability_score}}{100} \times 0.3 \right) + \left(\frac{\text{quality_rating_score}}{100} \times 0.3 \right)$$",
-            "",
-            "# Supplier Evaluation Summary",
-            f"Total Suppliers Evaluated: {len(self.suppliers)}",
-            "",
-            "# Detailed Analysis for Each Supplier"
-        ]
-        
-        for i, supplier in enumerate(ranked_suppliers, 1):
-            is_top = supplier.overall_score == top_score
-            report_sections.append(self.generate_supplier_analysis(supplier, i, is_top))
-        
-        report_sections.extend([
-            "",
-            "# Final Ranking",
-            f"Top supplier(s) with overall score of {top_score}:",
-        ])
-        
-        for supplier in ranked_suppliers:
-            if supplier.overall_score == top_score:
-                report_sections.append(f"- Supplier {supplier.supplier_id}")
-        
-        report_sections.extend([
-            "",
-            "# Feedback Request",
-            "Would you like detailed calculations for any specific supplier? Rate this analysis (1-5)."
-        ])
-        
-        return "\n".join(report_sections)
+        scores = supplier.price_score, supplier.delivery_reliability_score, supplier.quality_rating_score
+        components, = _score_components(*zip(scores))
+        return _format_supplier_analysis(supplier.supplier_id, *scores, components,
+                                         supplier.overall_score, rank, is_top)
+
+    def generate_final_report(self, top_k: Optional[int] = None) -> str:
+        if top_k is not None and top_k < 0:
+            raise ValueError(f"ERROR: Invalid top_k: {top_k}. Please provide a non-negative number.")
+        # The report is a pure function of the supplier table, so repeated calls on
+        # unchanged data return the cached text instead of rendering it again.
+        table = self.suppliers
+        if table is not self._report_table or table.generation != self._report_generation:
+            self._report_table, self._report_generation = table, table.generation
+            self._report_cache = {}
+        cache = self._report_cache
+        report = cache.get(top_k)
+        if report is None:
+            if len(cache) >= REPORT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            report = cache[top_k] = self._render_final_report(top_k)
+        return report
+
+    def _render_final_report(self, top_k: Optional[int]) -> str:
+        # Detailed analyses are rendered for the top_k ranked suppliers only (all of
+        # them by default); the rest are listed in a compact ranking table.
+        table = self.suppliers
+        order = table.ranking()
+        top_hundredths = table.overall_hundredths[order[0]] if order else 0
+        top_score = top_hundredths / 100 if order else 0
+        # Ties for the top score form a prefix of the ranking, so one C-level count
+        # identifies all top suppliers.
+        top_count = table.overall_hundredths.count(top_hundredths)
+
+        # Only the detailed rows are gathered, then each is formatted exactly as
+        # generate_supplier_analysis() would format it. Components come from the
+        # table, so rows already shown by an earlier report are not rounded again.
+        detailed = order if top_k is None else order[:top_k]
+        supplier_ids, prices, deliveries, qualities, hundredths = (
+            map(column.__getitem__, detailed)
+            for column in (table.supplier_ids, table.price_scores, table.delivery_reliability_scores,
+                           table.quality_rating_scores, table.overall_hundredths)
+        )
+        components = table.score_components(detailed)
+
+        # Sections are written straight into one growing buffer, each preceded by the
+        # newline that separates it from the previous one.
+        buffer = StringIO()
+        write = buffer.write
+        write(self.generate_validation_report())
+        write("\n")
+        write(REPORT_HEADER_TEMPLATE % len(table))
+        for rank, (supplier_id, price, delivery, quality, overall, row_components) in enumerate(
+                zip(supplier_ids, prices, deliveries, qualities, hundredths, components), 1):
+            write("\n")
+            write(_format_supplier_analysis(
+                supplier_id, price, delivery, quality, row_components,
+                overall / 100, rank, rank <= top_count
+            ))
+
+        if len(detailed) < len(order):
+            write("\n")
+            write(REMAINING_RANKING_HEADER)
+            for rank, index in enumerate(order[len(detailed):], len(detailed) + 1):
+                write(REMAINING_RANKING_ROW_TEMPLATE % (rank, table.supplier_ids[index], table.overall_hundredths[index] / 100))
+
+        write("\n")
+        write(FINAL_RANKING_TEMPLATE % top_score)
+        for index in order[:top_count]:
+            write(TOP_SUPPLIER_TEMPLATE % table.supplier_ids[index])
+        write("\n")
+        write(FEEDBACK_REQUEST)
+
+        return buffer.getvalue()
 
 def main():
     # Your supplier data